@@ -101,10 +101,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "suhoor_audio_file": None,
         "unsub_timer": None,
         "playback_reset_unsub": None,
+        "minute_unsub": None,
     }
 
     store = hass.data[DOMAIN][entry.entry_id]
 
+    # Close the coordinator's shared HTTP session on unload. Registered
+    # before the first refresh so a ConfigEntryNotReady there doesn't leak
+    # the session created during the failed fetch.
+    entry.async_on_unload(coordinator.async_close)
+
     # Initial data fetch
     await coordinator.async_config_entry_first_refresh()
 
@@ -214,6 +220,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if reset_unsub:
         reset_unsub()
 
+    # Cancel the shared minute ticker
+    minute_unsub = store.get("minute_unsub")
+    if minute_unsub:
+        minute_unsub()
+
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unloaded:
@@ -508,11 +519,8 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
             continue
         if prayer["name"] in coordinator.data.played_today:
             continue
-        # Make prayer time timezone-aware for comparison
-        prayer_time = prayer["time"]
-        if prayer_time.tzinfo is None:
-            prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-        target_time = prayer_time - timedelta(minutes=offset_minutes)
+        # Prayer times come tz-aware from _normalize_times
+        target_time = prayer["time"] - timedelta(minutes=offset_minutes)
         if target_time > now:
             next_prayer = prayer
             break
@@ -540,10 +548,7 @@ def _schedule_next_prayer(hass: HomeAssistant, entry: ConfigEntry) -> None:
         )
         return
 
-    prayer_time = next_prayer["time"]
-    if prayer_time.tzinfo is None:
-        prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-    target_time = prayer_time - timedelta(minutes=offset_minutes)
+    target_time = next_prayer["time"] - timedelta(minutes=offset_minutes)
     _LOGGER.info(
         "Scheduled %s azan at %s (offset: -%dm)",
         next_prayer["name"],
@@ -580,7 +585,7 @@ def _register_services(hass: HomeAssistant, entry: ConfigEntry) -> None:
         store = hass.data[DOMAIN].get(entry.entry_id)
         if store:
             coordinator: AzanCoordinator = store["coordinator"]
-            await coordinator.async_refresh()
+            await coordinator.async_force_refresh()
             _schedule_next_prayer(hass, entry)
 
     if not hass.services.has_service(DOMAIN, "play_azan"):
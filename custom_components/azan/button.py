@@ -29,17 +29,15 @@ async def async_setup_entry(
 class AzanBaseButton(ButtonEntity):
     """Base class for Azan buttons."""
 
+    __slots__ = ("_entry",)
+
     _attr_has_entity_name = True
 
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize the button."""
         self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
             name="Minaret",
             manufacturer="Minaret",
             model="Prayer Times",
@@ -50,17 +48,14 @@ class AzanBaseButton(ButtonEntity):
 class AzanTestPlayButton(AzanBaseButton):
     """Button to test azan playback."""
 
+    _attr_name = "Test Play"
+
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize the test play button."""
         super().__init__(entry)
         self._attr_unique_id = f"{entry.entry_id}_test_play"
         self._attr_icon = "mdi:play-circle"
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return "Test Play"
-
     async def async_press(self) -> None:
         """Handle button press."""
         await self.hass.services.async_call(
@@ -73,17 +68,14 @@ class AzanTestPlayButton(AzanBaseButton):
 class AzanRefreshButton(AzanBaseButton):
     """Button to refresh prayer times."""
 
+    _attr_name = "Refresh Times"
+
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize the refresh button."""
         super().__init__(entry)
         self._attr_unique_id = f"{entry.entry_id}_refresh_times"
         self._attr_icon = "mdi:refresh"
 
-    @property
-    def name(self) -> str:
-        """Return the name."""
-        return "Refresh Times"
-
     async def async_press(self) -> None:
         """Handle button press."""
         await self.hass.services.async_call(
@@ -38,33 +38,271 @@ from .const import (
 )
 
 
+# Shared validators, compiled once at import time
+_OFFSET_RANGE = vol.All(int, vol.Range(min=0, max=30))
+_SUHOOR_OFFSET_RANGE = vol.All(int, vol.Range(min=15, max=120))
+
+_METHOD_CHOICES = vol.In(CALC_METHODS)
+
+# Constant label/key prefixes for the device picker, shared across calls
+# instead of re-interpolated per entity
+_SPEAKER = "🔊 "
+_PHONE = "📱 "
+_MP_PREFIX = "media_player:"
+_NOTIFY_PREFIX = "notify:"
+
+# Routes a submitted output device to the next flow step by its prefix,
+# so adding new device types means adding a table entry rather than
+# another startswith branch
+_NEXT_STEP_BY_PREFIX = {
+    "notify": "android_settings",
+    "media_player": "prayer_source",
+}
+
+# The device picker rebuilds its schema per render (the choices vary),
+# but the marker and the no-devices fallback schema are static
+_R_OUTPUT_DEVICE = vol.Required(CONF_OUTPUT_DEVICE)
+_OUTPUT_DEVICE_FALLBACK_SCHEMA = vol.Schema({_R_OUTPUT_DEVICE: str})
+
+_SOURCE_LABELS = {
+    SOURCE_QATAR_MOI: "Qatar MOI (portal.moi.gov.qa)",
+    SOURCE_ALADHAN: "AlAdhan API (aladhan.com)",
+}
+
+# Static step schemas (no per-user defaults), built once at import time
+# instead of on every step render
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_AZAN_URL): str,
+        vol.Optional(CONF_FAJR_URL, default=""): str,
+    }
+)
+
+_ANDROID_SETTINGS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EXTERNAL_URL): str,
+    }
+)
+
+_PRAYER_SOURCE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PRAYER_SOURCE, default=DEFAULT_SOURCE): vol.In(
+            _SOURCE_LABELS
+        ),
+    }
+)
+
+_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_OFFSET_MINUTES, default=DEFAULT_OFFSET_MINUTES
+        ): _OFFSET_RANGE,
+        vol.Required(CONF_PRAYER_FAJR, default=True): bool,
+        vol.Required(CONF_PRAYER_SUNRISE, default=False): bool,
+        vol.Required(CONF_PRAYER_DHUHR, default=True): bool,
+        vol.Required(CONF_PRAYER_ASR, default=True): bool,
+        vol.Required(CONF_PRAYER_MAGHRIB, default=True): bool,
+        vol.Required(CONF_PRAYER_ISHA, default=True): bool,
+    }
+)
+
+_SUHOOR_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SUHOOR_ENABLED, default=False): bool,
+        vol.Required(
+            CONF_SUHOOR_OFFSET, default=DEFAULT_SUHOOR_OFFSET
+        ): _SUHOOR_OFFSET_RANGE,
+        vol.Required(CONF_SUHOOR_RAMADAN_ONLY, default=True): bool,
+        vol.Optional(CONF_SUHOOR_URL, default=""): str,
+    }
+)
+
+_LOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_CITY, default="Doha"): str,
+        vol.Required(CONF_COUNTRY, default="Qatar"): str,
+        vol.Required(CONF_METHOD, default=DEFAULT_METHOD): _METHOD_CHOICES,
+    }
+)
+
+
+# Schema builders shared by the config and options flows. With no
+# defaults they return the precompiled module-level schema; with a
+# `defaults` dict (the merged entry data+options) they build a schema
+# seeded with the current values.
+
+
+def _schema_user(defaults: dict | None = None) -> vol.Schema:
+    """Build the audio settings schema."""
+    if defaults is None:
+        return _USER_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_AZAN_URL, default=defaults.get(CONF_AZAN_URL, "")
+            ): str,
+            vol.Optional(
+                CONF_FAJR_URL, default=defaults.get(CONF_FAJR_URL, "")
+            ): str,
+        }
+    )
+
+
+def _schema_android(defaults: dict | None = None) -> vol.Schema:
+    """Build the Android external-URL schema."""
+    if defaults is None:
+        return _ANDROID_SETTINGS_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_EXTERNAL_URL, default=defaults.get(CONF_EXTERNAL_URL, "")
+            ): str,
+        }
+    )
+
+
+def _schema_prayer_source(defaults: dict | None = None) -> vol.Schema:
+    """Build the prayer source schema."""
+    if defaults is None:
+        return _PRAYER_SOURCE_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_PRAYER_SOURCE,
+                default=defaults.get(CONF_PRAYER_SOURCE, DEFAULT_SOURCE),
+            ): vol.In(_SOURCE_LABELS),
+        }
+    )
+
+
+def _schema_location(defaults: dict | None = None) -> vol.Schema:
+    """Build the AlAdhan location schema."""
+    if defaults is None:
+        return _LOCATION_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(CONF_CITY, default=defaults.get(CONF_CITY, "Doha")): str,
+            vol.Required(
+                CONF_COUNTRY, default=defaults.get(CONF_COUNTRY, "Qatar")
+            ): str,
+            vol.Required(
+                CONF_METHOD, default=defaults.get(CONF_METHOD, DEFAULT_METHOD)
+            ): _METHOD_CHOICES,
+        }
+    )
+
+
+def _schema_schedule(defaults: dict | None = None) -> vol.Schema:
+    """Build the schedule and prayer-toggles schema."""
+    if defaults is None:
+        return _SCHEDULE_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_OFFSET_MINUTES,
+                default=defaults.get(CONF_OFFSET_MINUTES, DEFAULT_OFFSET_MINUTES),
+            ): _OFFSET_RANGE,
+            vol.Required(
+                CONF_PRAYER_FAJR, default=defaults.get(CONF_PRAYER_FAJR, True)
+            ): bool,
+            vol.Required(
+                CONF_PRAYER_SUNRISE,
+                default=defaults.get(CONF_PRAYER_SUNRISE, False),
+            ): bool,
+            vol.Required(
+                CONF_PRAYER_DHUHR, default=defaults.get(CONF_PRAYER_DHUHR, True)
+            ): bool,
+            vol.Required(
+                CONF_PRAYER_ASR, default=defaults.get(CONF_PRAYER_ASR, True)
+            ): bool,
+            vol.Required(
+                CONF_PRAYER_MAGHRIB,
+                default=defaults.get(CONF_PRAYER_MAGHRIB, True),
+            ): bool,
+            vol.Required(
+                CONF_PRAYER_ISHA, default=defaults.get(CONF_PRAYER_ISHA, True)
+            ): bool,
+        }
+    )
+
+
+def _schema_suhoor(defaults: dict | None = None) -> vol.Schema:
+    """Build the Suhoor alarm schema."""
+    if defaults is None:
+        return _SUHOOR_SCHEMA
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SUHOOR_ENABLED,
+                default=defaults.get(CONF_SUHOOR_ENABLED, False),
+            ): bool,
+            vol.Required(
+                CONF_SUHOOR_OFFSET,
+                default=defaults.get(CONF_SUHOOR_OFFSET, DEFAULT_SUHOOR_OFFSET),
+            ): _SUHOOR_OFFSET_RANGE,
+            vol.Required(
+                CONF_SUHOOR_RAMADAN_ONLY,
+                default=defaults.get(CONF_SUHOOR_RAMADAN_ONLY, True),
+            ): bool,
+            vol.Optional(
+                CONF_SUHOOR_URL, default=defaults.get(CONF_SUHOOR_URL, "")
+            ): str,
+        }
+    )
+
+
+# Cache for _get_output_devices, keyed on the exact entity ids and notify
+# service names seen at build time. Kept at module level so it never leaks
+# into hass.data[DOMAIN], which async_unload_entry inspects to decide when
+# the last entry is gone.
+_DEVICE_CACHE: tuple[tuple, dict[str, str]] | None = None
+
+
 def _get_output_devices(hass: HomeAssistant) -> dict[str, str]:
     """Discover all available output devices dynamically.
 
     Returns a dict of {device_id: friendly_label} with:
     - All media_player entities (speakers, TVs, etc.)
     - All mobile_app notify services (Android/iOS phones)
+
+    The result is cached keyed on the media_player entity ids and notify
+    service names, so walking back and forth through the flow doesn't
+    re-scan the full state machine on every step render while any added,
+    removed or replaced device still invalidates the cache.
     """
+    global _DEVICE_CACHE
+
+    notify_services = hass.services.async_services().get("notify", ())
+    media_player_ids = hass.states.async_entity_ids("media_player")
+    token = (tuple(media_player_ids), tuple(notify_services))
+    if _DEVICE_CACHE is not None and _DEVICE_CACHE[0] == token:
+        return _DEVICE_CACHE[1]
+
     devices: dict[str, str] = {}
 
-    # Discover media_player entities
-    for state in hass.states.async_all("media_player"):
-        entity_id = state.entity_id
-        name = state.attributes.get("friendly_name", entity_id)
-        devices[f"media_player:{entity_id}"] = f"🔊 {name}"
+    # Discover media_player entities (ids only -- avoids materializing a
+    # full State list when we only need one attribute per entity)
+    for entity_id in media_player_ids:
+        state = hass.states.async_get(entity_id)
+        name = state.attributes.get("friendly_name", entity_id) if state else entity_id
+        devices[_MP_PREFIX + entity_id] = _SPEAKER + name
 
-    # Discover mobile_app notify services
-    for service_name in hass.services.async_services().get("notify", {}):
+    # Discover mobile_app notify services; the prefix is fixed-length so
+    # slice it off rather than paying two .replace passes per service
+    for service_name in notify_services:
         if service_name.startswith("mobile_app_"):
-            device_name = service_name.replace("mobile_app_", "").replace("_", " ").title()
-            devices[f"notify:{service_name}"] = f"📱 {device_name}"
+            device_name = service_name[11:].replace("_", " ").title()
+            devices[_NOTIFY_PREFIX + service_name] = _PHONE + device_name
 
+    _DEVICE_CACHE = (token, devices)
     return devices
 
 
 class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Azan Prayer Times."""
 
+    __slots__ = ("_data",)
+
     VERSION = 1
 
     def __init__(self) -> None:
@@ -81,12 +319,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_AZAN_URL): str,
-                    vol.Optional(CONF_FAJR_URL, default=""): str,
-                }
-            ),
+            data_schema=_schema_user(),
         )
 
     async def async_step_output_device(
@@ -101,10 +334,10 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "no_device"
             else:
                 self._data.update(user_input)
-                # If android device, ask for external URL
-                if device.startswith("notify:"):
-                    return await self.async_step_android_settings()
-                return await self.async_step_prayer_source()
+                # Android devices need an external URL step next
+                prefix = device.partition(":")[0]
+                next_step = _NEXT_STEP_BY_PREFIX.get(prefix, "prayer_source")
+                return await getattr(self, f"async_step_{next_step}")()
 
         devices = _get_output_devices(self.hass)
 
@@ -112,11 +345,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
             # No devices found, show a text field as fallback
             return self.async_show_form(
                 step_id="output_device",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_OUTPUT_DEVICE): str,
-                    }
-                ),
+                data_schema=_OUTPUT_DEVICE_FALLBACK_SCHEMA,
                 description_placeholders={
                     "device_help": "No devices found. Enter a media_player entity ID or notify service name manually."
                 },
@@ -125,11 +354,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="output_device",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_OUTPUT_DEVICE): vol.In(devices),
-                }
-            ),
+            data_schema=vol.Schema({_R_OUTPUT_DEVICE: vol.In(devices)}),
             errors=errors,
         )
 
@@ -143,11 +368,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="android_settings",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_EXTERNAL_URL): str,
-                }
-            ),
+            data_schema=_schema_android(),
         )
 
     async def async_step_prayer_source(
@@ -162,18 +383,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="prayer_source",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_PRAYER_SOURCE, default=DEFAULT_SOURCE
-                    ): vol.In(
-                        {
-                            SOURCE_QATAR_MOI: "Qatar MOI (portal.moi.gov.qa)",
-                            SOURCE_ALADHAN: "AlAdhan API (aladhan.com)",
-                        }
-                    ),
-                }
-            ),
+            data_schema=_schema_prayer_source(),
         )
 
     async def async_step_location(
@@ -184,19 +394,9 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
             self._data.update(user_input)
             return await self.async_step_schedule()
 
-        method_options = {k: v for k, v in CALC_METHODS.items()}
-
         return self.async_show_form(
             step_id="location",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_CITY, default="Doha"): str,
-                    vol.Required(CONF_COUNTRY, default="Qatar"): str,
-                    vol.Required(CONF_METHOD, default=DEFAULT_METHOD): vol.In(
-                        method_options
-                    ),
-                }
-            ),
+            data_schema=_schema_location(),
         )
 
     async def async_step_schedule(
@@ -209,19 +409,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="schedule",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_OFFSET_MINUTES, default=DEFAULT_OFFSET_MINUTES
-                    ): vol.All(int, vol.Range(min=0, max=30)),
-                    vol.Required(CONF_PRAYER_FAJR, default=True): bool,
-                    vol.Required(CONF_PRAYER_SUNRISE, default=False): bool,
-                    vol.Required(CONF_PRAYER_DHUHR, default=True): bool,
-                    vol.Required(CONF_PRAYER_ASR, default=True): bool,
-                    vol.Required(CONF_PRAYER_MAGHRIB, default=True): bool,
-                    vol.Required(CONF_PRAYER_ISHA, default=True): bool,
-                }
-            ),
+            data_schema=_schema_schedule(),
         )
 
     async def async_step_suhoor(
@@ -239,16 +427,7 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="suhoor",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_SUHOOR_ENABLED, default=False): bool,
-                    vol.Required(
-                        CONF_SUHOOR_OFFSET, default=DEFAULT_SUHOOR_OFFSET
-                    ): vol.All(int, vol.Range(min=15, max=120)),
-                    vol.Required(CONF_SUHOOR_RAMADAN_ONLY, default=True): bool,
-                    vol.Optional(CONF_SUHOOR_URL, default=""): str,
-                }
-            ),
+            data_schema=_schema_suhoor(),
         )
 
     @staticmethod
@@ -261,10 +440,15 @@ class AzanConfigFlow(ConfigFlow, domain=DOMAIN):
 class AzanOptionsFlow(OptionsFlow):
     """Handle options flow for Azan Prayer Times."""
 
+    __slots__ = ("_config_entry", "_data", "_current")
+
     def __init__(self, config_entry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
         self._data: dict = {}
+        # Merged view of data+options; options can't change between steps
+        # of the same flow instance, so compute it once
+        self._current: dict = {**config_entry.data, **config_entry.options}
 
     async def async_step_init(
         self, user_input: dict | None = None
@@ -274,22 +458,9 @@ class AzanOptionsFlow(OptionsFlow):
             self._data.update(user_input)
             return await self.async_step_output_device()
 
-        current = {**self._config_entry.data, **self._config_entry.options}
-
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_AZAN_URL,
-                        default=current.get(CONF_AZAN_URL, ""),
-                    ): str,
-                    vol.Optional(
-                        CONF_FAJR_URL,
-                        default=current.get(CONF_FAJR_URL, ""),
-                    ): str,
-                }
-            ),
+            data_schema=_schema_user(self._current),
         )
 
     async def async_step_output_device(
@@ -304,11 +475,11 @@ class AzanOptionsFlow(OptionsFlow):
                 errors["base"] = "no_device"
             else:
                 self._data.update(user_input)
-                if device.startswith("notify:"):
-                    return await self.async_step_android_settings()
-                return await self.async_step_prayer_source()
+                prefix = device.partition(":")[0]
+                next_step = _NEXT_STEP_BY_PREFIX.get(prefix, "prayer_source")
+                return await getattr(self, f"async_step_{next_step}")()
 
-        current = {**self._config_entry.data, **self._config_entry.options}
+        current = self._current
         devices = _get_output_devices(self.hass)
 
         current_device = current.get(CONF_OUTPUT_DEVICE, "")
@@ -327,20 +498,19 @@ class AzanOptionsFlow(OptionsFlow):
                 errors=errors,
             )
 
-        # If current device is in the list, use it as default
-        default = current_device if current_device in devices else None
-
-        schema_dict: dict = {}
-        if default:
-            schema_dict[vol.Required(CONF_OUTPUT_DEVICE, default=default)] = vol.In(
-                devices
-            )
-        else:
-            schema_dict[vol.Required(CONF_OUTPUT_DEVICE)] = vol.In(devices)
+        # Preselect the current device when it's still in the list;
+        # vol.UNDEFINED keeps the field default-less in one code path
+        default = current_device if current_device in devices else vol.UNDEFINED
 
         return self.async_show_form(
             step_id="output_device",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_OUTPUT_DEVICE, default=default): vol.In(
+                        devices
+                    ),
+                }
+            ),
             errors=errors,
         )
 
@@ -352,18 +522,9 @@ class AzanOptionsFlow(OptionsFlow):
             self._data.update(user_input)
             return await self.async_step_prayer_source()
 
-        current = {**self._config_entry.data, **self._config_entry.options}
-
         return self.async_show_form(
             step_id="android_settings",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_EXTERNAL_URL,
-                        default=current.get(CONF_EXTERNAL_URL, ""),
-                    ): str,
-                }
-            ),
+            data_schema=_schema_android(self._current),
         )
 
     async def async_step_prayer_source(
@@ -376,23 +537,9 @@ class AzanOptionsFlow(OptionsFlow):
                 return await self.async_step_location()
             return await self.async_step_schedule()
 
-        current = {**self._config_entry.data, **self._config_entry.options}
-
         return self.async_show_form(
             step_id="prayer_source",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_PRAYER_SOURCE,
-                        default=current.get(CONF_PRAYER_SOURCE, DEFAULT_SOURCE),
-                    ): vol.In(
-                        {
-                            SOURCE_QATAR_MOI: "Qatar MOI (portal.moi.gov.qa)",
-                            SOURCE_ALADHAN: "AlAdhan API (aladhan.com)",
-                        }
-                    ),
-                }
-            ),
+            data_schema=_schema_prayer_source(self._current),
         )
 
     async def async_step_location(
@@ -403,25 +550,9 @@ class AzanOptionsFlow(OptionsFlow):
             self._data.update(user_input)
             return await self.async_step_schedule()
 
-        current = {**self._config_entry.data, **self._config_entry.options}
-        method_options = {k: v for k, v in CALC_METHODS.items()}
-
         return self.async_show_form(
             step_id="location",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_CITY, default=current.get(CONF_CITY, "Doha")
-                    ): str,
-                    vol.Required(
-                        CONF_COUNTRY, default=current.get(CONF_COUNTRY, "Qatar")
-                    ): str,
-                    vol.Required(
-                        CONF_METHOD,
-                        default=current.get(CONF_METHOD, DEFAULT_METHOD),
-                    ): vol.In(method_options),
-                }
-            ),
+            data_schema=_schema_location(self._current),
         )
 
     async def async_step_schedule(
@@ -432,44 +563,9 @@ class AzanOptionsFlow(OptionsFlow):
             self._data.update(user_input)
             return await self.async_step_suhoor()
 
-        current = {**self._config_entry.data, **self._config_entry.options}
-
         return self.async_show_form(
             step_id="schedule",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_OFFSET_MINUTES,
-                        default=current.get(
-                            CONF_OFFSET_MINUTES, DEFAULT_OFFSET_MINUTES
-                        ),
-                    ): vol.All(int, vol.Range(min=0, max=30)),
-                    vol.Required(
-                        CONF_PRAYER_FAJR,
-                        default=current.get(CONF_PRAYER_FAJR, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_PRAYER_SUNRISE,
-                        default=current.get(CONF_PRAYER_SUNRISE, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_PRAYER_DHUHR,
-                        default=current.get(CONF_PRAYER_DHUHR, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_PRAYER_ASR,
-                        default=current.get(CONF_PRAYER_ASR, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_PRAYER_MAGHRIB,
-                        default=current.get(CONF_PRAYER_MAGHRIB, True),
-                    ): bool,
-                    vol.Required(
-                        CONF_PRAYER_ISHA,
-                        default=current.get(CONF_PRAYER_ISHA, True),
-                    ): bool,
-                }
-            ),
+            data_schema=_schema_schedule(self._current),
         )
 
     async def async_step_suhoor(
@@ -480,28 +576,7 @@ class AzanOptionsFlow(OptionsFlow):
             self._data.update(user_input)
             return self.async_create_entry(title="", data=self._data)
 
-        current = {**self._config_entry.data, **self._config_entry.options}
-
         return self.async_show_form(
             step_id="suhoor",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SUHOOR_ENABLED,
-                        default=current.get(CONF_SUHOOR_ENABLED, False),
-                    ): bool,
-                    vol.Required(
-                        CONF_SUHOOR_OFFSET,
-                        default=current.get(CONF_SUHOOR_OFFSET, DEFAULT_SUHOOR_OFFSET),
-                    ): vol.All(int, vol.Range(min=15, max=120)),
-                    vol.Required(
-                        CONF_SUHOOR_RAMADAN_ONLY,
-                        default=current.get(CONF_SUHOOR_RAMADAN_ONLY, True),
-                    ): bool,
-                    vol.Optional(
-                        CONF_SUHOOR_URL,
-                        default=current.get(CONF_SUHOOR_URL, ""),
-                    ): str,
-                }
-            ),
+            data_schema=_schema_suhoor(self._current),
         )
@@ -1,5 +1,7 @@
 """Constants for the Minaret integration."""
 
+from types import MappingProxyType
+
 DOMAIN = "azan"
 
 # Config keys
@@ -32,23 +34,23 @@ CONF_PRAYER_ASR = "prayer_asr"
 CONF_PRAYER_MAGHRIB = "prayer_maghrib"
 CONF_PRAYER_ISHA = "prayer_isha"
 
-PRAYER_TOGGLES = [
+PRAYER_TOGGLES = (
     CONF_PRAYER_FAJR,
     CONF_PRAYER_SUNRISE,
     CONF_PRAYER_DHUHR,
     CONF_PRAYER_ASR,
     CONF_PRAYER_MAGHRIB,
     CONF_PRAYER_ISHA,
-]
+)
 
 # Prayer sources
 SOURCE_QATAR_MOI = "qatar_moi"
 SOURCE_ALADHAN = "aladhan"
 
 # Ordered list of prayers
-PRAYER_ORDER = ["Fajr", "Sunrise", "Dhuhr", "Asr", "Maghrib", "Isha"]
+PRAYER_ORDER = ("Fajr", "Sunrise", "Dhuhr", "Asr", "Maghrib", "Isha")
 
-PRAYER_ICONS = {
+PRAYER_ICONS = MappingProxyType({
     "Fajr": "mdi:weather-sunset-up",
     "Sunrise": "mdi:weather-sunny",
     "Dhuhr": "mdi:mosque",
@@ -56,10 +58,10 @@ PRAYER_ICONS = {
     "Maghrib": "mdi:weather-sunset-down",
     "Isha": "mdi:weather-night",
     "Suhoor": "mdi:silverware-fork-knife",
-}
+})
 
 # Qatar MOI name normalization
-NAME_MAP = {
+NAME_MAP = MappingProxyType({
     "fajer": "Fajr",
     "fajr": "Fajr",
     "sunrise": "Sunrise",
@@ -68,10 +70,10 @@ NAME_MAP = {
     "asr": "Asr",
     "maghrib": "Maghrib",
     "isha": "Isha",
-}
+})
 
 # AlAdhan calculation methods
-CALC_METHODS = {
+CALC_METHODS = MappingProxyType({
     0: "Shia Ithna-Ashari",
     1: "University of Islamic Sciences, Karachi",
     2: "Islamic Society of North America",
@@ -87,7 +89,7 @@ CALC_METHODS = {
     13: "Diyanet Isleri Baskanligi, Turkey",
     14: "Spiritual Administration of Muslims of Russia",
     15: "Moonsighting Committee Worldwide",
-}
+})
 
 # Defaults
 DEFAULT_OFFSET_MINUTES = 0
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import logging
-import re
-from datetime import datetime, timedelta
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, time as dt_time, timedelta
+from html.parser import HTMLParser
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
@@ -16,7 +23,13 @@ from .const import (
     CONF_CITY,
     CONF_COUNTRY,
     CONF_METHOD,
+    CONF_PRAYER_ASR,
+    CONF_PRAYER_DHUHR,
+    CONF_PRAYER_FAJR,
+    CONF_PRAYER_ISHA,
+    CONF_PRAYER_MAGHRIB,
     CONF_PRAYER_SOURCE,
+    CONF_PRAYER_SUNRISE,
     CONF_SUHOOR_ENABLED,
     CONF_SUHOOR_OFFSET,
     CONF_SUHOOR_RAMADAN_ONLY,
@@ -29,6 +42,82 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# (prayer name, config key, default) rows for the per-prayer enable map
+_PRAYER_ENABLE_DEFAULTS = (
+    ("Fajr", CONF_PRAYER_FAJR, True),
+    ("Sunrise", CONF_PRAYER_SUNRISE, False),
+    ("Dhuhr", CONF_PRAYER_DHUHR, True),
+    ("Asr", CONF_PRAYER_ASR, True),
+    ("Maghrib", CONF_PRAYER_MAGHRIB, True),
+    ("Isha", CONF_PRAYER_ISHA, True),
+)
+
+# Hijri date memo keyed by Gregorian ordinal day; the conversion is a
+# branchy pure-Python walk that only changes once per calendar day, while
+# dashboards read it on every state poll
+_HIJRI_CACHE: dict[int, tuple] = {}
+
+
+def _hijri_today() -> tuple[int, int, str, int] | None:
+    """Return today's Hijri date as (day, month, month_name, year).
+
+    Cached per calendar day and shared by the coordinator and sensors.
+    Returns None when hijri_converter is unavailable or fails.
+    """
+    key = date.today().toordinal()
+    cached = _HIJRI_CACHE.get(key)
+    if cached is None:
+        try:
+            from hijri_converter import Gregorian
+
+            hijri = Gregorian.today().to_hijri()
+        except Exception:
+            return None
+        cached = (hijri.day, hijri.month, hijri.month_name(), hijri.year)
+        _HIJRI_CACHE.clear()
+        _HIJRI_CACHE[key] = cached
+    return cached
+
+
+class _MoiTableParser(HTMLParser):
+    """Single-pass extractor of <th>/<td> text from the MOI timings table.
+
+    One linear scan over the document, no regex backtracking and no
+    per-cell tag-stripping passes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        super().__init__()
+        self.headers: list[str] = []
+        self.cells: list[str] = []
+        self._target: list[str] | None = None
+        self._buffer: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        """Start collecting text inside th/td cells."""
+        if tag == "th":
+            self._target = self.headers
+            self._buffer = []
+        elif tag == "td":
+            self._target = self.cells
+            self._buffer = []
+
+    def handle_endtag(self, tag: str) -> None:
+        """Flush the collected cell text."""
+        if tag in ("th", "td") and self._target is not None:
+            text = "".join(self._buffer).strip()
+            # Headers drop empty cells (matches the old regex filter);
+            # data cells keep positional alignment with their headers
+            if self._target is self.cells or text:
+                self._target.append(text)
+            self._target = None
+
+    def handle_data(self, data: str) -> None:
+        """Accumulate text while inside a cell."""
+        if self._target is not None:
+            self._buffer.append(data)
+
 
 class PrayerData:
     """Container for prayer time data."""
@@ -44,12 +133,40 @@ class PrayerData:
         """Initialize prayer data."""
         self.prayers = prayers
         self.date = date
+        # Index by name for O(1) sensor lookups, and keep a parallel
+        # sorted seconds-of-day array (prayers arrive in chronological
+        # order from _normalize_times, all on the same local day) so the
+        # next-prayer search is pure integer compares
+        self.by_name = {p["name"]: p for p in prayers}
+        self._sec_of_day = array(
+            "i",
+            (p["time"].hour * 3600 + p["time"].minute * 60 for p in prayers),
+        )
         self.played_today: set[str] = set()
         self.hijri_month = hijri_month
         self.hijri_day = hijri_day
         self.hijri_month_name = hijri_month_name
         self.is_ramadan = (hijri_month == 9) if hijri_month else False
 
+    def next_after(self, now: datetime, enabled_only: bool = False) -> dict | None:
+        """Return the first prayer after ``now``.
+
+        With ``enabled_only`` the scan skips disabled prayers after the
+        bisect, so the common case stays O(log n).
+        """
+        now_sec = now.hour * 3600 + now.minute * 60 + now.second
+        idx = bisect_right(self._sec_of_day, now_sec)
+        for i in range(idx, len(self.prayers)):
+            prayer = self.prayers[i]
+            if enabled_only and not prayer["enabled"]:
+                continue
+            # Guard with the full datetime: if this data is from a
+            # previous day (e.g. just after midnight, before the refresh
+            # lands), every prayer has already passed and there is no
+            # next prayer, even though its second-of-day sorts later.
+            return prayer if prayer["time"] > now else None
+        return None
+
 
 class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
     """Coordinator to fetch and manage prayer times."""
@@ -63,46 +180,92 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
             update_interval=timedelta(hours=6),
         )
         self.config = config
+        # Flat merged data+options view; setup passes the merged dict and
+        # options updates reload the entry (recreating the coordinator),
+        # so every read can hit this single dict
+        self._merged_config: dict = dict(config)
         self._last_date: str | None = None
+        self._session: aiohttp.ClientSession | None = None
+        # Last raw fetch keyed by date, so same-day refreshes skip the
+        # network round-trip and only re-run normalization
+        self._raw_cache: tuple[str, dict, dict] | None = None
+        self._enabled_cache: dict[str, bool] | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps DNS results and TCP/TLS connections warm
+        across refreshes instead of paying the full handshake every 6 hours.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={"User-Agent": "Mozilla/5.0"},
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=3600),
+            )
+        return self._session
 
-    def get_config_value(self, key: str, default=None):
-        """Get a config value, checking options first then data."""
-        if hasattr(self, "config_entry") and self.config_entry is not None:
-            options = self.config_entry.options
-            data = self.config_entry.data
-            return options.get(key, data.get(key, default))
-        return self.config.get(key, default)
+    async def async_close(self) -> None:
+        """Close the shared HTTP session on unload."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
-    async def _async_update_data(self) -> PrayerData:
-        """Fetch prayer times from the configured source."""
-        source = self.config.get(CONF_PRAYER_SOURCE, SOURCE_QATAR_MOI)
+    def get_config_value(self, key: str, default=None):
+        """Get a config value from the flat merged data+options dict."""
+        return self._merged_config.get(key, default)
 
-        hijri_month = None
-        hijri_day = None
-        hijri_month_name = None
+    async def async_force_refresh(self) -> None:
+        """Refetch prayer times, bypassing the same-day raw cache.
 
-        try:
-            if source == SOURCE_QATAR_MOI:
-                raw = await self._fetch_qatar_moi()
-                # Use hijri-converter for Hijri date
-                try:
-                    from hijri_converter import Gregorian
-
-                    hijri = Gregorian.today().to_hijri()
-                    hijri_month = hijri.month
-                    hijri_day = hijri.day
-                    hijri_month_name = hijri.month_name()
-                except Exception:
-                    _LOGGER.debug("Could not determine Hijri date")
-            else:
-                raw, hijri_info = await self._fetch_aladhan()
-                hijri_month = hijri_info.get("month")
-                hijri_day = hijri_info.get("day")
-                hijri_month_name = hijri_info.get("month_name")
-        except Exception as err:
-            raise UpdateFailed(f"Failed to fetch prayer times: {err}") from err
+        Used by the Refresh Times button/service, whose whole point is to
+        hit the network again; scheduled refreshes keep using the cache.
+        """
+        self._raw_cache = None
+        await self.async_refresh()
 
+    async def _async_update_data(self) -> PrayerData:
+        """Fetch prayer times from the configured source."""
+        source = self._merged_config.get(CONF_PRAYER_SOURCE, SOURCE_QATAR_MOI)
         today = dt_util.now().strftime("%Y-%m-%d")
+
+        if self._raw_cache is not None and self._raw_cache[0] == today:
+            # The sources serve one payload per day; reuse the cached raw
+            # fetch and only re-run normalization (config may have changed)
+            _, raw, hijri_info = self._raw_cache
+            hijri_month = hijri_info.get("month")
+            hijri_day = hijri_info.get("day")
+            hijri_month_name = hijri_info.get("month_name")
+        else:
+            hijri_month = None
+            hijri_day = None
+            hijri_month_name = None
+
+            try:
+                if source == SOURCE_QATAR_MOI:
+                    raw = await self._fetch_qatar_moi()
+                    # Use hijri-converter for Hijri date (cached per day)
+                    hijri = _hijri_today()
+                    if hijri is not None:
+                        hijri_day, hijri_month, hijri_month_name = hijri[:3]
+                    else:
+                        _LOGGER.debug("Could not determine Hijri date")
+                else:
+                    raw, hijri_info = await self._fetch_aladhan()
+                    hijri_month = hijri_info.get("month")
+                    hijri_day = hijri_info.get("day")
+                    hijri_month_name = hijri_info.get("month_name")
+            except Exception as err:
+                raise UpdateFailed(f"Failed to fetch prayer times: {err}") from err
+
+            self._raw_cache = (
+                today,
+                raw,
+                {
+                    "month": hijri_month,
+                    "day": hijri_day,
+                    "month_name": hijri_month_name,
+                },
+            )
         is_ramadan = (hijri_month == 9) if hijri_month else False
         prayers = self._normalize_times(raw, is_ramadan)
 
@@ -122,10 +285,12 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
             "Prayer times refreshed for %s (tz=%s)",
             today, dt_util.get_default_time_zone(),
         )
-        for p in prayers:
-            _LOGGER.info(
-                "  %s: %s (%s) enabled=%s",
-                p["name"], p["time_str"], p["time"].isoformat(), p["enabled"],
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Prayers: %s",
+                ", ".join(
+                    f"{p['name']}={p['time_str']}({p['enabled']})" for p in prayers
+                ),
             )
 
         return data
@@ -134,29 +299,26 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
         """Fetch prayer times from Qatar MOI portal."""
         url = "https://portal.moi.gov.qa/MoiPortalRestServices/rest/prayertimings/today/en"
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, headers={"User-Agent": "Mozilla/5.0"}
-            ) as resp:
-                resp.raise_for_status()
-                html = await resp.text()
-
-        # Parse table headers and cells
-        headers = [
-            re.sub(r"<[^>]+>", "", m).strip()
-            for m in re.findall(r"<th[^>]*>(.*?)</th>", html, re.DOTALL)
-            if re.sub(r"<[^>]+>", "", m).strip()
-        ]
-        cells = [
-            m.strip()
-            for m in re.findall(r"<td[^>]*>(.*?)</td>", html, re.DOTALL)
-        ]
+        session = await self._get_session()
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            # Read raw bytes and decode directly; resp.text() would run
+            # charset detection over the whole body first
+            html = (await resp.read()).decode("utf-8", "replace")
+
+        # Parse table headers and cells in a single pass
+        parser = _MoiTableParser()
+        parser.feed(html)
+        parser.close()
+        headers = parser.headers
+        cells = parser.cells
 
         times: dict[str, str] = {}
-        for i, header in enumerate(headers):
-            if i < len(cells):
-                key = NAME_MAP.get(header.lower(), header)
-                times[key] = cells[i]
+        for header, cell in zip(headers, cells):
+            # NAME_MAP is keyed lowercase; try the header as-is first
+            # so already-lowercase headers skip the .lower() copy
+            key = NAME_MAP.get(header) or NAME_MAP.get(header.lower(), header)
+            times[key] = cell
 
         if not times:
             raise UpdateFailed("Qatar MOI returned no prayer times")
@@ -165,20 +327,23 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
 
     async def _fetch_aladhan(self) -> tuple[dict[str, str], dict]:
         """Fetch prayer times and Hijri date from AlAdhan API."""
-        city = self.config.get(CONF_CITY, "Doha")
-        country = self.config.get(CONF_COUNTRY, "Qatar")
-        method = self.config.get(CONF_METHOD, 10)
+        city = self._merged_config.get(CONF_CITY, "Doha")
+        country = self._merged_config.get(CONF_COUNTRY, "Qatar")
+        method = self._merged_config.get(CONF_METHOD, 10)
 
         url = (
             f"https://api.aladhan.com/v1/timingsByCity"
             f"?city={city}&country={country}&method={method}"
         )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, headers={"User-Agent": "Mozilla/5.0"}
-            ) as resp:
-                resp.raise_for_status()
+        session = await self._get_session()
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            # HA ships orjson; fall back to aiohttp's stdlib parser if
+            # it's ever unavailable
+            if orjson is not None:
+                data = orjson.loads(await resp.read())
+            else:
                 data = await resp.json()
 
         timings = data["data"]["timings"]
@@ -209,30 +374,27 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
         ha_tz = dt_util.get_default_time_zone()
         # Build today's date in HA's timezone for constructing prayer times
         today_local = now.astimezone(ha_tz).date()
-        config = self.config
-
-        # Build enabled map from prayer toggle config keys
-        enabled_map = {
-            "Fajr": config.get("prayer_fajr", True),
-            "Sunrise": config.get("prayer_sunrise", False),
-            "Dhuhr": config.get("prayer_dhuhr", True),
-            "Asr": config.get("prayer_asr", True),
-            "Maghrib": config.get("prayer_maghrib", True),
-            "Isha": config.get("prayer_isha", True),
-        }
-
-        # Sort entries by prayer order
-        entries = sorted(
-            raw.items(),
-            key=lambda x: (
-                PRAYER_ORDER.index(x[0]) if x[0] in PRAYER_ORDER else 99
-            ),
-        )
+        config = self._merged_config
+
+        # Enabled map derives from entry config, which is fixed for this
+        # coordinator's lifetime (options updates reload the entry), so
+        # build it lazily once and reuse on cache-hit refreshes
+        enabled_map = self._enabled_cache
+        if enabled_map is None:
+            enabled_map = {
+                name: config.get(key, default)
+                for name, key, default in _PRAYER_ENABLE_DEFAULTS
+            }
+            self._enabled_cache = enabled_map
 
         prayers = []
         fajr_time = None
-        for name, time_str in entries:
-            if name not in PRAYER_ORDER:
+        fajr_idx = 0
+        # Iterating PRAYER_ORDER keeps the output ordered by construction
+        # (no sort) and drops unknown names from raw for free
+        for name in PRAYER_ORDER:
+            time_str = raw.get(name)
+            if time_str is None:
                 continue
 
             # Parse HH:MM (handles both "HH:MM" and "HH:MM (timezone)" formats)
@@ -250,19 +412,20 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
 
             # Construct prayer time explicitly in HA's timezone
             # Prayer times from the API are always in local time
-            prayer_time = datetime(
-                today_local.year, today_local.month, today_local.day,
-                hour, minute, 0, tzinfo=ha_tz,
+            prayer_time = datetime.combine(
+                today_local, dt_time(hour, minute), tzinfo=ha_tz
             )
 
             if name == "Fajr":
                 fajr_time = prayer_time
+                fajr_idx = len(prayers)
 
             prayers.append(
                 {
                     "name": name,
                     "time": prayer_time,
                     "time_str": f"{hour:02d}:{minute:02d}",
+                    "time_iso": prayer_time.isoformat(),
                     "enabled": enabled_map.get(name, False),
                 }
             )
@@ -278,12 +441,10 @@ class AzanCoordinator(DataUpdateCoordinator[PrayerData]):
                     "name": "Suhoor",
                     "time": suhoor_time,
                     "time_str": f"{suhoor_time.hour:02d}:{suhoor_time.minute:02d}",
+                    "time_iso": suhoor_time.isoformat(),
                     "enabled": True,
                 }
-                # Insert before Fajr
-                fajr_idx = next(
-                    (i for i, p in enumerate(prayers) if p["name"] == "Fajr"), 0
-                )
+                # Insert before Fajr (index captured during the main loop)
                 prayers.insert(fajr_idx, suhoor_entry)
                 _LOGGER.debug(
                     "Suhoor alarm at %s (%d min before Fajr)",
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import CONF_SUHOOR_ENABLED, DOMAIN, PRAYER_ICONS, PRAYER_ORDER
-from .coordinator import AzanCoordinator
+from .coordinator import AzanCoordinator, _hijri_today
+
+
+def _minute_signal(entry_id: str) -> str:
+    """Dispatcher signal fired once a minute for time-driven sensors."""
+    return f"{DOMAIN}_minute_{entry_id}"
 
 
 async def async_setup_entry(
@@ -33,8 +41,15 @@ async def async_setup_entry(
     for prayer_name in PRAYER_ORDER:
         entities.append(PrayerTimeSensor(coordinator, entry, prayer_name))
 
-    # Suhoor time sensor (only when enabled)
-    if config.get(CONF_SUHOOR_ENABLED, False):
+    # Suhoor time sensor -- only when enabled and the coordinator actually
+    # produced a Suhoor entry (it's omitted outside Ramadan when
+    # suhoor_ramadan_only is set), so we don't register a permanently
+    # empty entity
+    if (
+        config.get(CONF_SUHOOR_ENABLED, False)
+        and coordinator.data
+        and "Suhoor" in coordinator.data.by_name
+    ):
         entities.append(SuhoorTimeSensor(coordinator, entry))
 
     # Next prayer sensor
@@ -52,6 +67,16 @@ async def async_setup_entry(
     # Status sensor
     entities.append(AzanStatusSensor(coordinator, entry))
 
+    # One shared ticker for all time-driven sensors, aligned to the
+    # minute boundary so the countdown matches the wall clock
+    signal = _minute_signal(entry.entry_id)
+
+    @callback
+    def _tick(_now) -> None:
+        async_dispatcher_send(hass, signal)
+
+    store["minute_unsub"] = async_track_time_change(hass, _tick, second=0)
+
     async_add_entities(entities)
 
 
@@ -96,6 +121,13 @@ class PrayerTimeSensor(AzanBaseSensor):
         self._attr_unique_id = f"{entry.entry_id}_{prayer_name.lower()}"
         self._attr_translation_key = prayer_name.lower()
         self._attr_icon = PRAYER_ICONS.get(prayer_name, "mdi:mosque")
+        self._attrs_cache: dict | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate cached attributes when data or played state changes."""
+        self._attrs_cache = None
+        super()._handle_coordinator_update()
 
     @property
     def name(self) -> str:
@@ -112,30 +144,29 @@ class PrayerTimeSensor(AzanBaseSensor):
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return extra attributes."""
-        prayer = self._get_prayer()
-        if not prayer:
-            return {}
+        """Return extra attributes (cached until the coordinator updates)."""
+        attrs = self._attrs_cache
+        if attrs is None:
+            prayer = self._get_prayer()
+            if not prayer:
+                return {}
 
-        played = False
-        if self.coordinator.data:
             played = self._prayer_name in self.coordinator.data.played_today
 
-        return {
-            "enabled": prayer["enabled"],
-            "played": played,
-            "datetime": prayer["time"].isoformat(),
-            "prayer_name": self._prayer_name,
-        }
+            attrs = {
+                "enabled": prayer["enabled"],
+                "played": played,
+                "datetime": prayer["time_iso"],
+                "prayer_name": self._prayer_name,
+            }
+            self._attrs_cache = attrs
+        return attrs
 
     def _get_prayer(self) -> dict | None:
         """Get the prayer data for this sensor."""
         if not self.coordinator.data:
             return None
-        for prayer in self.coordinator.data.prayers:
-            if prayer["name"] == self._prayer_name:
-                return prayer
-        return None
+        return self.coordinator.data.by_name.get(self._prayer_name)
 
 
 class NextPrayerSensor(AzanBaseSensor):
@@ -151,6 +182,14 @@ class NextPrayerSensor(AzanBaseSensor):
         self._attr_unique_id = f"{entry.entry_id}_next_prayer"
         self._attr_icon = "mdi:mosque"
         self._unsub_timer = None
+        # (minute key, prayer) memo shared by native_value/icon/attributes
+        self._cached_next: tuple[int, dict | None] = (0, None)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the memo so fresh data isn't served from the old PrayerData."""
+        self._cached_next = (0, None)
+        super()._handle_coordinator_update()
 
     @property
     def name(self) -> str:
@@ -158,10 +197,10 @@ class NextPrayerSensor(AzanBaseSensor):
         return "Next Prayer"
 
     async def async_added_to_hass(self) -> None:
-        """Start per-minute timer when added."""
+        """Subscribe to the shared minute ticker when added."""
         await super().async_added_to_hass()
-        self._unsub_timer = async_track_time_interval(
-            self.hass, self._update_state, timedelta(minutes=1)
+        self._unsub_timer = async_dispatcher_connect(
+            self.hass, _minute_signal(self._entry.entry_id), self._update_state
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -170,8 +209,9 @@ class NextPrayerSensor(AzanBaseSensor):
             self._unsub_timer()
 
     @callback
-    def _update_state(self, _now) -> None:
+    def _update_state(self) -> None:
         """Force state update every minute."""
+        self._cached_next = (0, None)
         self.async_write_ha_state()
 
     @property
@@ -197,37 +237,28 @@ class NextPrayerSensor(AzanBaseSensor):
         if not prayer:
             return {}
 
-        from homeassistant.util import dt as dt_util
-        now = dt_util.now()
-        prayer_time = prayer["time"]
-        if prayer_time.tzinfo is None:
-            prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-        diff = prayer_time - now
+        # Prayer times are built tz-aware in _normalize_times
+        diff = prayer["time"] - dt_util.now()
         minutes_until = max(0, int(diff.total_seconds() / 60))
 
         return {
             "time": prayer["time_str"],
             "countdown_minutes": minutes_until,
-            "datetime": prayer["time"].isoformat(),
+            "datetime": prayer["time_iso"],
         }
 
     def _get_next_prayer(self) -> dict | None:
-        """Find the next upcoming enabled prayer."""
+        """Find the next upcoming enabled prayer (memoized per minute)."""
         if not self.coordinator.data:
             return None
-
-        from homeassistant.util import dt as dt_util
         now = dt_util.now()
-        for prayer in self.coordinator.data.prayers:
-            if not prayer["enabled"]:
-                continue
-            prayer_time = prayer["time"]
-            # Make timezone-aware for proper comparison
-            if prayer_time.tzinfo is None:
-                prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-            if prayer_time > now:
-                return prayer
-        return None
+        minute_key = int(now.timestamp()) // 60
+        cached_key, cached_prayer = self._cached_next
+        if cached_key == minute_key:
+            return cached_prayer
+        prayer = self.coordinator.data.next_after(now, enabled_only=True)
+        self._cached_next = (minute_key, prayer)
+        return prayer
 
 
 class AzanCountdownSensor(AzanBaseSensor):
@@ -244,6 +275,14 @@ class AzanCountdownSensor(AzanBaseSensor):
         self._attr_icon = "mdi:timer-sand"
         self._attr_native_unit_of_measurement = "min"
         self._unsub_timer = None
+        # (minute key, prayer) memo shared by native_value/attributes
+        self._cached_next: tuple[int, dict | None] = (0, None)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Drop the memo so fresh data isn't served from the old PrayerData."""
+        self._cached_next = (0, None)
+        super()._handle_coordinator_update()
 
     @property
     def name(self) -> str:
@@ -251,10 +290,10 @@ class AzanCountdownSensor(AzanBaseSensor):
         return "Countdown"
 
     async def async_added_to_hass(self) -> None:
-        """Start the per-minute timer when added."""
+        """Subscribe to the shared minute ticker when added."""
         await super().async_added_to_hass()
-        self._unsub_timer = async_track_time_interval(
-            self.hass, self._update_countdown, timedelta(minutes=1)
+        self._unsub_timer = async_dispatcher_connect(
+            self.hass, _minute_signal(self._entry.entry_id), self._update_countdown
         )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -263,8 +302,9 @@ class AzanCountdownSensor(AzanBaseSensor):
             self._unsub_timer()
 
     @callback
-    def _update_countdown(self, _now) -> None:
+    def _update_countdown(self) -> None:
         """Force a state write every minute."""
+        self._cached_next = (0, None)
         self.async_write_ha_state()
 
     @property
@@ -273,12 +313,7 @@ class AzanCountdownSensor(AzanBaseSensor):
         prayer = self._get_next_prayer()
         if not prayer:
             return None
-        from homeassistant.util import dt as dt_util
-        now = dt_util.now()
-        prayer_time = prayer["time"]
-        if prayer_time.tzinfo is None:
-            prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-        diff = prayer_time - now
+        diff = prayer["time"] - dt_util.now()
         return max(0, int(diff.total_seconds() / 60))
 
     @property
@@ -288,12 +323,7 @@ class AzanCountdownSensor(AzanBaseSensor):
         if not prayer:
             return {"prayer_name": None, "time": None, "hours": 0, "minutes": 0, "seconds": 0}
 
-        from homeassistant.util import dt as dt_util
-        now = dt_util.now()
-        prayer_time = prayer["time"]
-        if prayer_time.tzinfo is None:
-            prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-        diff = prayer_time - now
+        diff = prayer["time"] - dt_util.now()
         total_seconds = max(0, int(diff.total_seconds()))
         return {
             "prayer_name": prayer["name"],
@@ -301,22 +331,21 @@ class AzanCountdownSensor(AzanBaseSensor):
             "hours": total_seconds // 3600,
             "minutes": (total_seconds % 3600) // 60,
             "seconds": total_seconds % 60,
-            "datetime": prayer["time"].isoformat(),
+            "datetime": prayer["time_iso"],
         }
 
     def _get_next_prayer(self) -> dict | None:
-        """Find the next upcoming prayer (enabled or not, for countdown)."""
+        """Find the next upcoming prayer (enabled or not), memoized per minute."""
         if not self.coordinator.data:
             return None
-        from homeassistant.util import dt as dt_util
         now = dt_util.now()
-        for prayer in self.coordinator.data.prayers:
-            prayer_time = prayer["time"]
-            if prayer_time.tzinfo is None:
-                prayer_time = prayer_time.replace(tzinfo=now.tzinfo)
-            if prayer_time > now:
-                return prayer
-        return None
+        minute_key = int(now.timestamp()) // 60
+        cached_key, cached_prayer = self._cached_next
+        if cached_key == minute_key:
+            return cached_prayer
+        prayer = self.coordinator.data.next_after(now)
+        self._cached_next = (minute_key, prayer)
+        return prayer
 
 
 class HijriDateSensor(AzanBaseSensor):
@@ -340,29 +369,25 @@ class HijriDateSensor(AzanBaseSensor):
     @property
     def native_value(self) -> str | None:
         """Return the Hijri date string."""
-        try:
-            from hijri_converter import Gregorian
-
-            hijri = Gregorian.today().to_hijri()
-            return f"{hijri.day} {hijri.month_name()} {hijri.year} AH"
-        except Exception:
+        hijri = _hijri_today()
+        if hijri is None:
             return None
+        day, _month, month_name, year = hijri
+        return f"{day} {month_name} {year} AH"
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return Hijri date components."""
-        try:
-            from hijri_converter import Gregorian
-
-            hijri = Gregorian.today().to_hijri()
-            return {
-                "day": hijri.day,
-                "month": hijri.month,
-                "month_name": hijri.month_name(),
-                "year": hijri.year,
-            }
-        except Exception:
+        hijri = _hijri_today()
+        if hijri is None:
             return {}
+        day, month, month_name, year = hijri
+        return {
+            "day": day,
+            "month": month,
+            "month_name": month_name,
+            "year": year,
+        }
 
 
 class SuhoorTimeSensor(AzanBaseSensor):
@@ -377,12 +402,24 @@ class SuhoorTimeSensor(AzanBaseSensor):
         super().__init__(coordinator, entry)
         self._attr_unique_id = f"{entry.entry_id}_suhoor"
         self._attr_icon = PRAYER_ICONS.get("Suhoor", "mdi:silverware-fork-knife")
+        self._attrs_cache: dict | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Invalidate cached attributes when data or played state changes."""
+        self._attrs_cache = None
+        super()._handle_coordinator_update()
 
     @property
     def name(self) -> str:
         """Return the name."""
         return "Suhoor"
 
+    @property
+    def available(self) -> bool:
+        """Only available while the data contains a Suhoor entry."""
+        return super().available and self._get_suhoor() is not None
+
     @property
     def native_value(self) -> str | None:
         """Return the Suhoor time as HH:MM string."""
@@ -393,29 +430,28 @@ class SuhoorTimeSensor(AzanBaseSensor):
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return extra attributes."""
-        prayer = self._get_suhoor()
-        if not prayer:
-            return {}
+        """Return extra attributes (cached until the coordinator updates)."""
+        attrs = self._attrs_cache
+        if attrs is None:
+            prayer = self._get_suhoor()
+            if not prayer:
+                return {}
 
-        played = False
-        if self.coordinator.data:
             played = "Suhoor" in self.coordinator.data.played_today
 
-        return {
-            "enabled": prayer["enabled"],
-            "played": played,
-            "datetime": prayer["time"].isoformat(),
-        }
+            attrs = {
+                "enabled": prayer["enabled"],
+                "played": played,
+                "datetime": prayer["time_iso"],
+            }
+            self._attrs_cache = attrs
+        return attrs
 
     def _get_suhoor(self) -> dict | None:
         """Get the Suhoor entry from prayers list."""
         if not self.coordinator.data:
             return None
-        for prayer in self.coordinator.data.prayers:
-            if prayer["name"] == "Suhoor":
-                return prayer
-        return None
+        return self.coordinator.data.by_name.get("Suhoor")
 
 
 class RamadanSensor(AzanBaseSensor):